@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+GitHub API payloads replayed by the integration tests in `test_client`.
+
+Trimmed to the fields `GithubOrgClient` and the tests read.
+"""
+
+org_payload = {
+    "login": "google",
+    "id": 1342004,
+    "url": "https://api.github.com/orgs/google",
+    "repos_url": "https://api.github.com/orgs/google/repos",
+    "description": "Google Open Source",
+    "public_repos": 1738,
+}
+
+repos_payload = [
+    {
+        "id": 7697149,
+        "name": "episodes.dart",
+        "full_name": "google/episodes.dart",
+        "private": False,
+        "html_url": "https://github.com/google/episodes.dart",
+        "description": "A framework for timing performance of web apps.",
+        "fork": False,
+        "url": "https://api.github.com/repos/google/episodes.dart",
+        "license": {
+            "key": "bsd-3-clause",
+            "name": "BSD 3-Clause \"New\" or \"Revised\" License",
+            "spdx_id": "BSD-3-Clause",
+        },
+    },
+    {
+        "id": 7776515,
+        "name": "cpp-netlib",
+        "full_name": "google/cpp-netlib",
+        "private": False,
+        "html_url": "https://github.com/google/cpp-netlib",
+        "description": "The C++ Network Library Project",
+        "fork": False,
+        "url": "https://api.github.com/repos/google/cpp-netlib",
+        "license": {
+            "key": "bsl-1.0",
+            "name": "Boost Software License 1.0",
+            "spdx_id": "BSL-1.0",
+        },
+    },
+    {
+        "id": 7968417,
+        "name": "dagger",
+        "full_name": "google/dagger",
+        "private": False,
+        "html_url": "https://github.com/google/dagger",
+        "description": "A fast dependency injector for Android and Java.",
+        "fork": False,
+        "url": "https://api.github.com/repos/google/dagger",
+        "license": {
+            "key": "apache-2.0",
+            "name": "Apache License 2.0",
+            "spdx_id": "Apache-2.0",
+        },
+    },
+    {
+        "id": 7968450,
+        "name": "ios-webkit-debug-proxy",
+        "full_name": "google/ios-webkit-debug-proxy",
+        "private": False,
+        "html_url": "https://github.com/google/ios-webkit-debug-proxy",
+        "description": "A DevTools proxy for iOS devices",
+        "fork": False,
+        "url": "https://api.github.com/repos/google/ios-webkit-debug-proxy",
+        "license": {
+            "key": "other",
+            "name": "Other",
+            "spdx_id": "NOASSERTION",
+        },
+    },
+    {
+        "id": 8165161,
+        "name": "google.github.io",
+        "full_name": "google/google.github.io",
+        "private": False,
+        "html_url": "https://github.com/google/google.github.io",
+        "description": None,
+        "fork": False,
+        "url": "https://api.github.com/repos/google/google.github.io",
+        "license": None,
+    },
+    {
+        "id": 8566972,
+        "name": "kratu",
+        "full_name": "google/kratu",
+        "private": False,
+        "html_url": "https://github.com/google/kratu",
+        "description": None,
+        "fork": False,
+        "url": "https://api.github.com/repos/google/kratu",
+        "license": {
+            "key": "apache-2.0",
+            "name": "Apache License 2.0",
+            "spdx_id": "Apache-2.0",
+        },
+    },
+    {
+        "id": 8576379,
+        "name": "build-debian-cloud",
+        "full_name": "google/build-debian-cloud",
+        "private": False,
+        "html_url": "https://github.com/google/build-debian-cloud",
+        "description": "Script for building Debian images",
+        "fork": False,
+        "url": "https://api.github.com/repos/google/build-debian-cloud",
+        "license": {
+            "key": "other",
+            "name": "Other",
+            "spdx_id": "NOASSERTION",
+        },
+    },
+    {
+        "id": 8858648,
+        "name": "traceur-compiler",
+        "full_name": "google/traceur-compiler",
+        "private": False,
+        "html_url": "https://github.com/google/traceur-compiler",
+        "description": "JavaScript.next-to-JavaScript-of-today compiler",
+        "fork": False,
+        "url": "https://api.github.com/repos/google/traceur-compiler",
+        "license": {
+            "key": "apache-2.0",
+            "name": "Apache License 2.0",
+            "spdx_id": "Apache-2.0",
+        },
+    },
+    {
+        "id": 9060347,
+        "name": "firmata.py",
+        "full_name": "google/firmata.py",
+        "private": False,
+        "html_url": "https://github.com/google/firmata.py",
+        "description": "Python client for the Firmata protocol",
+        "fork": False,
+        "url": "https://api.github.com/repos/google/firmata.py",
+        "license": {
+            "key": "apache-2.0",
+            "name": "Apache License 2.0",
+            "spdx_id": "Apache-2.0",
+        },
+    },
+]
+
+expected_repos = [
+    "episodes.dart",
+    "cpp-netlib",
+    "dagger",
+    "ios-webkit-debug-proxy",
+    "google.github.io",
+    "kratu",
+    "build-debian-cloud",
+    "traceur-compiler",
+    "firmata.py",
+]
+
+apache2_repos = [
+    "dagger",
+    "kratu",
+    "traceur-compiler",
+    "firmata.py",
+]
+
+# Rows in the (org_payload, repos_payload, expected_repos, apache2_repos)
+# order used by `parameterized_class`
+TEST_PAYLOAD = [
+    (org_payload, repos_payload, expected_repos, apache2_repos),
+]
@@ -2,141 +2,294 @@
 """
 Unit test suite for the `client` module.
 """
+import contextlib
+import functools
 import unittest
-from parameterized import parameterized, parameterized_class
-from client import GithubOrgClient
-from typing import Dict, List
-from unittest.mock import patch, Mock, PropertyMock
+from unittest.mock import patch
+
+from parameterized import parameterized_class
+
+import client
 import fixtures  # Import the fixtures
 
+GithubOrgClient = client.GithubOrgClient
+
+
+@contextlib.contextmanager
+def _prop(owner: type, name: str, fget):
+    """
+    Temporarily replaces `owner.name` with `property(fget)`, restoring
+    the original class attribute (or removing the stub) on exit.
+    """
+    sentinel = object()
+    orig = owner.__dict__.get(name, sentinel)
+    setattr(owner, name, property(fget))
+    try:
+        yield
+    finally:
+        if orig is sentinel:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, orig)
+
+
+class _Resp:
+    """
+    Minimal stand-in for a `requests.Response` exposing only `.json()`.
+    """
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload) -> None:
+        self._payload = payload
+
+    def json(self):
+        """Returns the wrapped payload."""
+        return self._payload
+
+
+# Payloads seen by `_resp_for`, keyed by id(); holding a reference keeps
+# each id valid for as long as its cached response
+_PAYLOADS = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_resp(payload_id: int) -> _Resp:
+    """Builds the response for a registered payload id."""
+    return _Resp(_PAYLOADS[payload_id])
+
+
+def _resp_for(payload) -> _Resp:
+    """
+    Returns the shared response wrapping `payload`, so every
+    parameterized class using the same fixture object reuses it.
+    """
+    _PAYLOADS[id(payload)] = payload
+    return _cached_resp(id(payload))
+
+
+_EMPTY_RESPONSE = _Resp({})
+
+
+class _Recorder:
+    """
+    Callable stub that records the URLs it is called with and returns
+    a configurable value; a cheap stand-in for a patched `get_json`.
+    """
+    __slots__ = ("calls", "return_value")
+
+    def __init__(self) -> None:
+        self.calls = []
+        self.return_value = None
+
+    def __call__(self, url: str):
+        self.calls.append(url)
+        return self.return_value
+
+    def reset(self) -> None:
+        """Forgets recorded calls and the configured return value."""
+        self.calls.clear()
+        self.return_value = None
+
+
+# Integration fixture rows from `fixtures.TEST_PAYLOAD`, in
+# `_INTEGRATION_FIELDS` order.
+# Payloads are shared by reference and expected repo names are frozen as
+# tuples once here, at import
+_INTEGRATION_FIELDS = (
+    "org_payload", "repos_payload", "expected_repos", "apache2_repos",
+)
+_INTEGRATION_FIXTURES = [
+    (org_payload, repos_payload, tuple(expected_repos), tuple(apache2_repos))
+    for org_payload, repos_payload, expected_repos, apache2_repos
+    in fixtures.TEST_PAYLOAD
+]
+
+# Org URLs used across the suite, formatted once at import instead of at
+# each call site: the unit test orgs plus every integration fixture login
+_ORG_URLS = {
+    name: GithubOrgClient.ORG_URL.format(org=name)
+    for name in (
+        "google", "abc",
+        *(org_payload["login"] for org_payload, *_ in _INTEGRATION_FIXTURES),
+    )
+}
+
+
+def _build_routes(rows) -> dict:
+    """
+    Maps the org and repos URL of every fixture row to its shared
+    response.
+    """
+    routes = {}
+    for org_payload, repos_payload, _, _ in rows:
+        routes[_ORG_URLS[org_payload["login"]]] = _resp_for(org_payload)
+        routes[org_payload["repos_url"]] = _resp_for(repos_payload)
+    return routes
+
+
+# URL -> response table for the integration tests; filled once by
+# setUpModule so merely importing or collecting the module skips it
+_ROUTES = {}
+
+
+def _mock_requests_get(url: str):
+    """
+    Side effect for requests.get. Returns the prebuilt response for
+    the URL, or one returning an empty dict for any other unhandled URL.
+    """
+    return _ROUTES.get(url, _EMPTY_RESPONSE)
+
+
+# Shared `requests.get` patcher, started once for the whole module
+_GET_PATCHER = patch('requests.get', side_effect=_mock_requests_get)
+_mock_get = None
+
+
+def setUpModule() -> None:
+    """
+    Builds the routing table and starts the shared `requests.get`
+    patcher before any test class runs.
+    """
+    global _mock_get
+    _ROUTES.update(_build_routes(_INTEGRATION_FIXTURES))
+    _mock_get = _GET_PATCHER.start()
+
+
+def tearDownModule() -> None:
+    """
+    Stops the shared `requests.get` patcher after all test classes ran.
+    """
+    _GET_PATCHER.stop()
+
 
 class TestGithubOrgClient(unittest.TestCase):
     """
     Defines test cases for the `GithubOrgClient` class.
     """
 
-    @parameterized.expand([
-        ("google",),
-        ("abc",),
-    ])
-    @patch('client.get_json')
-    def test_org(self, org_name: str, mock_get_json: Mock) -> None:
+    # Repos payload served by the `get_json` stub in `test_public_repos`,
+    # built once at import rather than on every run
+    _REPOS_PAYLOAD = (
+        {"name": "alx-backend", "license": {"key": "mit"}},
+        {"name": "holberton-web", "license": {"key": "apache-2.0"}},
+        {"name": "my-app", "license": None},
+        {"name": "old-project", "license": {"key": "gpl-3.0"}},
+    )
+    _EXPECTED_NAMES = ("alx-backend", "holberton-web", "my-app", "old-project")
+
+    @classmethod
+    def setUpClass(cls) -> None:
         """
-        Tests that `GithubOrgClient.org` returns the correct value
-        and `get_json` is called once with the correct URL.
+        Installs a single recording `get_json` stub for the whole class.
+        """
+        cls._orig_get_json = client.get_json
+        cls.get_json = client.get_json = _Recorder()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Restores the real `get_json`.
         """
-        # Define a test payload for the mock
-        test_payload = {"name": org_name, "repos_url": "http://example.com"}
-        mock_get_json.return_value = test_payload
+        client.get_json = cls._orig_get_json
 
-        # Instantiate the client
-        client = GithubOrgClient(org_name)
+    def setUp(self) -> None:
+        """
+        Resets the `get_json` stub before each test.
+        """
+        self.get_json.reset()
 
-        # Call the .org property
-        result = client.org
+    def test_org(self) -> None:
+        """
+        Tests that `GithubOrgClient.org` returns the correct value
+        and `get_json` is called once with the correct URL.
+        """
+        for org_name in ("google", "abc"):
+            with self.subTest(org=org_name):
+                # Define a test payload for the stub
+                test_payload = {
+                    "name": org_name,
+                    "repos_url": "http://example.com",
+                }
+                self.get_json.reset()
+                self.get_json.return_value = test_payload
 
-        # Define the expected URL
-        expected_url = f"https://api.github.com/orgs/{org_name}"
+                # Call the .org property
+                result = GithubOrgClient(org_name).org
 
-        # Assert get_json was called once with the correct URL
-        mock_get_json.assert_called_once_with(expected_url)
+                # Assert get_json was called once with the correct URL
+                self.assertEqual(self.get_json.calls, [_ORG_URLS[org_name]])
 
-        # Assert the result is the expected payload
-        self.assertEqual(result, test_payload)
+                # Assert the result is the expected payload
+                self.assertEqual(result, test_payload)
 
     def test_public_repos_url(self) -> None:
         """
         Tests that `GithubOrgClient._public_repos_url` returns the
-        correct URL based on the mocked `org` property.
+        correct URL based on the stubbed `org` property.
         """
         # Define a known payload for the `org` property
         known_payload = {"repos_url": "https://api.github.com/orgs/google/repos"}
 
-        # Patch the `org` property using patch.object and PropertyMock
-        with patch.object(GithubOrgClient,
-                          'org',
-                          new_callable=PropertyMock) as mock_org:
-            # Set the return value for the mocked property
-            mock_org.return_value = known_payload
-
-            # Instantiate the client
-            client = GithubOrgClient("google")
-
+        # Stub the `org` property directly on the class
+        with _prop(GithubOrgClient, 'org', lambda self: known_payload):
             # Access the `_public_repos_url` property
-            repos_url = client._public_repos_url
+            repos_url = GithubOrgClient("google")._public_repos_url
 
-            # Assert that the repos_url is the one from the payload
-            self.assertEqual(repos_url, known_payload["repos_url"])
+        # Assert that the repos_url is the one from the payload
+        self.assertEqual(repos_url, known_payload["repos_url"])
 
-    @patch('client.get_json')
-    def test_public_repos(self, mock_get_json: Mock) -> None:
+    def test_public_repos(self) -> None:
         """
         Tests that `GithubOrgClient.public_repos` returns the
-        correct list of repo names based on the mocked `repos_payload`.
+        correct list of repo names based on the stubbed `repos_payload`.
         """
-        # This is the payload that `get_json` will return
+        # `get_json` returns the class-level payload
         # (simulating the result of `repos_payload`)
-        repos_payload = [
-            {"name": "repo-one"},
-            {"name": "repo-two"},
-            {"name": "repo-three"}
-        ]
-        mock_get_json.return_value = repos_payload
+        self.get_json.return_value = self._REPOS_PAYLOAD
 
         # This is the URL that `_public_repos_url` will return
         test_repos_url = "https://api.github.com/orgs/test/repos"
 
-        # Patch `_public_repos_url` as a property
-        with patch.object(GithubOrgClient,
-                          '_public_repos_url',
-                          new_callable=PropertyMock) as mock_public_repos_url:
-
-            # Set the return value for the mocked property
-            mock_public_repos_url.return_value = test_repos_url
+        # Swap `_public_repos_url` for a recording stub
+        repos_url_calls = []
 
-            # Instantiate the client
-            client = GithubOrgClient("test")
+        def fake_repos_url(self):
+            repos_url_calls.append(self)
+            return test_repos_url
 
+        with _prop(GithubOrgClient, '_public_repos_url', fake_repos_url):
             # Call the method under test
-            public_repos = client.public_repos()
-
-            # Define the expected list of repo names
-            expected_repos = ["repo-one", "repo-two", "repo-three"]
+            public_repos = GithubOrgClient("test").public_repos()
 
-            # Assert the list of repos is as expected
-            self.assertEqual(public_repos, expected_repos)
+        # Assert the list of repos is as expected
+        self.assertEqual(tuple(public_repos), self._EXPECTED_NAMES)
 
-            # Assert the mocked property was called once
-            mock_public_repos_url.assert_called_once()
+        # Assert the stubbed property was read once
+        self.assertEqual(len(repos_url_calls), 1)
 
-            # Assert `get_json` was called once with the correct URL
-            # (which came from the mocked property)
-            mock_get_json.assert_called_once_with(test_repos_url)
+        # Assert `get_json` was called once with the correct URL
+        # (which came from the stubbed property)
+        self.assertEqual(self.get_json.calls, [test_repos_url])
 
-    @parameterized.expand([
-        ({"license": {"key": "my_license"}}, "my_license", True),
-        ({"license": {"key": "other_license"}}, "my_license", False),
-    ])
-    def test_has_license(self,
-                         repo: Dict,
-                         license_key: str,
-                         expected: bool) -> None:
+    def test_has_license(self) -> None:
         """
         Tests the `GithubOrgClient.has_license` static method
         with different repo payloads and license keys.
         """
-        result = GithubOrgClient.has_license(repo, license_key)
-        self.assertEqual(result, expected)
-
-
-@parameterized_class([
-    {
-        "org_payload": fixtures.org_payload,
-        "repos_payload": fixtures.repos_payload,
-        "expected_repos": fixtures.expected_repos,
-        "apache2_repos": fixtures.apache2_repos,
-    }
-])
+        cases = (
+            ({"license": {"key": "my_license"}}, "my_license", True),
+            ({"license": {"key": "other_license"}}, "my_license", False),
+            ({"name": "x"}, "my_license", False),
+            ({"license": {}}, "my_license", False),
+            ({}, "my_license", False),
+        )
+        has_license = GithubOrgClient.has_license
+        for repo, license_key, expected in cases:
+            with self.subTest(repo=repo, license_key=license_key):
+                self.assertIs(has_license(repo, license_key), expected)
+
+
+@parameterized_class(_INTEGRATION_FIELDS, _INTEGRATION_FIXTURES)
 class TestIntegrationGithubOrgClient(unittest.TestCase):
     """
     Integration test class for `GithubOrgClient`.
@@ -146,69 +299,41 @@ class TestIntegrationGithubOrgClient(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """
-        Sets up the class by patching `requests.get` to return
-        example payloads from fixtures.
+        Sets up the class against the module-wide `requests.get` patch,
+        which returns example payloads from fixtures.
         """
-        # Define the side_effect function for the mock
-        def mock_requests_get(url: str):
-            """
-            Side effect for requests.get. Returns a mock response
-            with a .json() method based on the URL.
-            """
-            mock_resp = Mock()
-
-            # Derive org_url from the repos_url in the fixture
-            # e.g., "https.../orgs/google/repos" -> "https.../orgs/google"
-            repos_url = cls.org_payload["repos_url"]
-            org_url = repos_url.replace("/repos", "")
-
-            if url == org_url:
-                mock_resp.json.return_value = cls.org_payload
-            elif url == repos_url:
-                mock_resp.json.return_value = cls.repos_payload
-            else:
-                # Return an empty dict for any other unhandled URL
-                mock_resp.json.return_value = {}
-
-            return mock_resp
-
-        # Start the patcher
-        cls.get_patcher = patch('requests.get', side_effect=mock_requests_get)
-        cls.mock_get = cls.get_patcher.start()
-
-    @classmethod
-    def tearDownClass(cls):
-        """
-        Stops the class-level patcher after all tests are run.
-        """
-        cls.get_patcher.stop()
+        cls._org_url = _ORG_URLS[cls.org_payload["login"]]
+
+        # Only record the requests made by this class
+        _mock_get.reset_mock()
+
+        # Compute both results once from a single client; `repos_payload`
+        # is memoized, so the org and repos URLs are each fetched once.
+        # Results are frozen as tuples to match the fixture rows
+        org_client = GithubOrgClient(cls.org_payload["login"])
+        cls._public_repos = tuple(org_client.public_repos())
+        cls._apache2_public_repos = tuple(
+            org_client.public_repos(license="apache-2.0"))
+        cls._requested_urls = [
+            call.args[0] for call in _mock_get.call_args_list
+        ]
 
     def test_public_repos(self):
         """
         Integration test for `GithubOrgClient.public_repos`
         without a license filter.
         """
-        # Instantiate the client using the org name from the fixture
-        org_name = self.org_payload["login"]
-        client = GithubOrgClient(org_name)
-
-        # Call public_repos
-        repos = client.public_repos()
-
         # Assert the result matches the expected repos from fixtures
-        self.assertEqual(repos, self.expected_repos)
+        self.assertEqual(self._public_repos, self.expected_repos)
+
+        # Assert the org URL and then the repos URL were each fetched once
+        self.assertEqual(self._requested_urls,
+                         [self._org_url, self.org_payload["repos_url"]])
 
     def test_public_repos_with_license(self):
         """
         Integration test for `GithubOrgClient.public_repos`
         with a license filter ("apache-2.0").
         """
-        # Instantiate the client using the org name from the fixture
-        org_name = self.org_payload["login"]
-        client = GithubOrgClient(org_name)
-
-        # Call public_repos with the license filter
-        repos = client.public_repos(license="apache-2.0")
-
         # Assert the result matches the apache2_repos from fixtures
-        self.assertEqual(repos, self.apache2_repos)
+        self.assertEqual(self._apache2_public_repos, self.apache2_repos)
@@ -3,10 +3,10 @@
 Unit test suite for the `utils` module.
 """
 import unittest
-from parameterized import parameterized
+from types import SimpleNamespace
+
+import utils
 from utils import access_nested_map, get_json, memoize
-from typing import Mapping, Sequence, Any, Dict
-from unittest.mock import patch, Mock
 
 
 class TestAccessNestedMap(unittest.TestCase):
@@ -14,35 +14,35 @@ class TestAccessNestedMap(unittest.TestCase):
     Defines test cases for the `access_nested_map` utility function.
     """
 
-    @parameterized.expand([
+    CASES = (
         ({"a": 1}, ("a",), 1),
         ({"a": {"b": 2}}, ("a",), {"b": 2}),
         ({"a": {"b": 2}}, ("a", "b"), 2),
-    ])
-    def test_access_nested_map(self,
-                             nested_map: Mapping,
-                             path: Sequence,
-                             expected: Any) -> None:
+    )
+    EXCEPTION_CASES = (
+        ({}, ("a",), 'a'),
+        ({"a": 1}, ("a", "b"), 'b'),
+    )
+
+    def test_access_nested_map(self) -> None:
         """
         Tests that `access_nested_map` correctly retrieves nested values.
         """
-        self.assertEqual(access_nested_map(nested_map, path), expected)
+        for nested_map, path, expected in self.CASES:
+            with self.subTest(path=path):
+                self.assertEqual(access_nested_map(nested_map, path),
+                                 expected)
 
-    @parameterized.expand([
-        ({}, ("a",), 'a'),
-        ({"a": 1}, ("a", "b"), 'b'),
-    ])
-    def test_access_nested_map_exception(self,
-                                       nested_map: Mapping,
-                                       path: Sequence,
-                                       expected_msg: str) -> None:
+    def test_access_nested_map_exception(self) -> None:
         """
         Tests that `access_nested_map` raises a KeyError with the
         expected message for invalid paths.
         """
-        with self.assertRaises(KeyError) as cm:
-            access_nested_map(nested_map, path)
-        self.assertEqual(str(cm.exception), f"'{expected_msg}'")
+        for nested_map, path, expected_msg in self.EXCEPTION_CASES:
+            with self.subTest(path=path):
+                with self.assertRaises(KeyError) as cm:
+                    access_nested_map(nested_map, path)
+                self.assertEqual(cm.exception.args[0], expected_msg)
 
 
 class TestGetJson(unittest.TestCase):
@@ -50,32 +50,54 @@ class TestGetJson(unittest.TestCase):
     Defines test cases for the `get_json` utility function.
     """
 
-    @parameterized.expand([
+    CASES = (
         ("http://example.com", {"payload": True}),
         ("http://holberton.io", {"payload": False}),
-    ])
-    @patch('utils.requests.get')
-    def test_get_json(self,
-                    test_url: str,
-                    test_payload: Dict,
-                    mock_get: Mock) -> None:
+    )
+
+    def test_get_json(self) -> None:
         """
         Tests that `get_json` returns the expected JSON payload
-        by mocking the `requests.get` call.
+        by stubbing the `requests.get` call.
         """
-        # Configure the mock to return a response object with a json method
-        mock_response = Mock()
-        mock_response.json.return_value = test_payload
-        mock_get.return_value = mock_response
+        for test_url, test_payload in self.CASES:
+            with self.subTest(url=test_url):
+                # Swap `requests.get` for a call-recording stub whose
+                # response exposes a json method
+                calls = []
+                response = SimpleNamespace(json=lambda p=test_payload: p)
 
-        # Call the function
-        result = get_json(test_url)
+                def fake_get(url):
+                    calls.append(url)
+                    return response
 
-        # Assert that requests.get was called once with the correct URL
-        mock_get.assert_called_once_with(test_url)
+                orig_get = utils.requests.get
+                utils.requests.get = fake_get
+                try:
+                    # Call the function
+                    result = get_json(test_url)
+                finally:
+                    utils.requests.get = orig_get
 
-        # Assert that the result is the expected payload
-        self.assertEqual(result, test_payload)
+                # Assert that requests.get was called once with the
+                # correct URL
+                self.assertEqual(calls, [test_url])
+
+                # Assert that the result is the expected payload
+                self.assertEqual(result, test_payload)
+
+
+class MemoizedClass:
+    """A test class for memoization, built once at import."""
+
+    def a_method(self) -> int:
+        """A method to be called."""
+        return 42
+
+    @memoize
+    def a_property(self) -> int:
+        """A memoized property."""
+        return self.a_method()
 
 
 class TestMemoize(unittest.TestCase):
@@ -88,31 +110,28 @@ class TestMemoize(unittest.TestCase):
         Tests that `memoize` caches the result of a method
         and the underlying method is only called once.
         """
-        class TestClass:
-            """A test class for memoization."""
-
-            def a_method(self) -> int:
-                """A method to be called."""
-                return 42
+        # Replace `a_method` on the MemoizedClass with a counting stub
+        calls = []
 
-            @memoize
-            def a_property(self) -> int:
-                """A memoized property."""
-                return self.a_method()
+        def a_method(self) -> int:
+            """Counts calls and returns the known value."""
+            calls.append(1)
+            return 42
 
-        # Patch the `a_method` on the TestClass
-        with patch.object(TestClass,
-                          'a_method',
-                          return_value=42) as mock_a_method:
-            test_obj = TestClass()
+        orig_a_method = MemoizedClass.a_method
+        MemoizedClass.a_method = a_method
+        try:
+            test_obj = MemoizedClass()
 
             # Call the memoized property twice
             result1 = test_obj.a_property
             result2 = test_obj.a_property
+        finally:
+            MemoizedClass.a_method = orig_a_method
 
-            # Check that the results are correct
-            self.assertEqual(result1, 42)
-            self.assertEqual(result2, 42)
+        # Check that the results are correct
+        self.assertEqual(result1, 42)
+        self.assertEqual(result2, 42)
 
-            # Check that the underlying method was only called once
-            mock_a_method.assert_called_once()
+        # Check that the underlying method was only called once
+        self.assertEqual(len(calls), 1)
@@ -1,27 +1,84 @@
+import atexit
+import json
 import logging
-from datetime import datetime
+import os
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
+import threading
 import time
+from collections import OrderedDict
+
+from django.http import HttpResponse
+
+# Dedicated request logger writing to 'requests.log', configured once at import
+# instead of through the root logger. Requests only enqueue records; a
+# background listener thread does the file writes.
+logger = logging.getLogger('chats.requests')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+file_handler = logging.FileHandler('requests.log', delay=True)
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s'))
+# Buffer records and write them in batches; errors flush immediately, a
+# background thread flushes every LOG_FLUSH_INTERVAL seconds so a quiet
+# server does not hold records back, and the buffer is written out when
+# logging shuts down. The trade-off: a process killed outright (SIGKILL,
+# OOM) loses at most the last few seconds of records, up to 100.
+LOG_FLUSH_INTERVAL = 5
+buffered_handler = MemoryHandler(
+    100, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+)
+log_queue = queue.Queue(-1)
+logger.addHandler(QueueHandler(log_queue))
+
+# Process that owns the running listener thread. Threads do not survive a
+# fork, so servers that fork after importing the app (gunicorn --preload)
+# need a listener started in each worker.
+_listener_pid = None
+_listener_lock = threading.Lock()
+
+
+def _flush_periodically(stop):
+    while not stop.wait(LOG_FLUSH_INTERVAL):
+        buffered_handler.flush()
+
+
+def _ensure_listener():
+    global _listener_pid
+    pid = os.getpid()
+    if _listener_pid == pid:
+        return
+    with _listener_lock:
+        if _listener_pid != pid:
+            listener = QueueListener(log_queue, buffered_handler, respect_handler_level=True)
+            listener.start()
+            # Flush whatever is still queued on shutdown
+            atexit.register(listener.stop)
+            stop_flushing = threading.Event()
+            threading.Thread(
+                target=_flush_periodically, args=(stop_flushing,), daemon=True
+            ).start()
+            atexit.register(stop_flushing.set)
+            _listener_pid = pid
 
-from django.http import JsonResponse
 
 class RequestLoggingMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
-        # Configure the logging to write to a file named 'requests.log'
-        logging.basicConfig(
-            filename='requests.log',
-            level=logging.INFO,
-            format='%(message)s'
-        )
 
     def __call__(self, request):
+        # Start this process's listener on its first request
+        _ensure_listener()
+
         # specific logic to log the user request
-        user = request.user if request.user.is_authenticated else "AnonymousUser"
-        log_message = f"{datetime.now()} - User: {user} - Path: {request.path}"
-        
-        # Write to the log file
-        logging.info(log_message)
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            user = "AnonymousUser"
+
+        # Write to the log file; the formatter adds the timestamp and the
+        # message is only rendered if the record is emitted
+        logger.info("User: %s - Path: %s", user, request.path)
 
         # Proceed with the request
         response = self.get_response(request)
@@ -30,18 +87,32 @@ class RequestLoggingMiddleware:
 class RestrictAccessByTimeMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
+        # Decision cached for the current minute: (minute, allowed). Stored as
+        # one tuple so concurrent requests never see a half-updated pair.
+        self._decision = (None, False)
+        # Denial body encoded once instead of on every rejected request
+        self._403_response_body = json.dumps(
+            {'error': 'Chat access is restricted to business hours (9 AM to 6 PM).'}
+        ).encode()
 
     def __call__(self, request):
-        # Get the current hour (0-23)
-        current_hour = datetime.now().hour
-        
-        # Define allowed hours: 9 AM to 6 PM (18:00)
-        # We assume the prompt meant 9 AM (09:00) to 6 PM (18:00). 
-        # Access is DENIED if it is BEFORE 9 AM or AFTER/EQUAL to 6 PM.
-        if current_hour < 9 or current_hour >= 18:
-            return JsonResponse(
-                {'error': 'Chat access is restricted to business hours (9 AM to 6 PM).'}, 
-                status=403
+        # The hour can only change on a minute boundary, so look up the
+        # local time once per minute
+        minute = int(time.time() // 60)
+        cached_minute, allowed = self._decision
+        if minute != cached_minute:
+            # Get the current hour (0-23)
+            current_hour = time.localtime().tm_hour
+
+            # Define allowed hours: 9 AM to 6 PM (18:00)
+            # We assume the prompt meant 9 AM (09:00) to 6 PM (18:00). 
+            # Access is DENIED if it is BEFORE 9 AM or AFTER/EQUAL to 6 PM.
+            allowed = 9 <= current_hour < 18
+            self._decision = (minute, allowed)
+
+        if not allowed:
+            return HttpResponse(
+                self._403_response_body, status=403, content_type='application/json'
             )
 
         response = self.get_response(request)
@@ -50,10 +121,35 @@ class RestrictAccessByTimeMiddleware:
     
     
 class OffensiveLanguageMiddleware:
+    # Upper bound on the number of IPs tracked at once
+    max_tracked_ips = 100_000
+
     def __init__(self, get_response):
         self.get_response = get_response
-        # Dictionary to store IP request history: {'127.0.0.1': [timestamp1, timestamp2]}
-        self.ip_requests = {}
+        # Sliding-window counters per IP: {'127.0.0.1': (window, current_count, previous_count)}
+        # where window is the current 60-second window number (epoch minute).
+        # Kept in least-recently-seen order so idle IPs sit at the front.
+        self.ip_requests = OrderedDict()
+        # Threaded servers call the same instance concurrently
+        self.lock = threading.Lock()
+        # Denial body encoded once instead of on every rejected request
+        self._429_response_body = json.dumps(
+            {'error': 'Rate limit exceeded. You can only send 5 messages per minute.'}
+        ).encode()
+
+    def _evict(self, window):
+        # Drop IPs not seen in the current or previous window; they no longer
+        # affect any estimate. Entries are in last-seen order, so stop at the
+        # first one that is still recent.
+        while self.ip_requests:
+            window_start = next(iter(self.ip_requests.values()))[0]
+            if window_start >= window - 1:
+                break
+            self.ip_requests.popitem(last=False)
+
+        # Still at capacity: drop the least recently seen IP
+        if len(self.ip_requests) >= self.max_tracked_ips:
+            self.ip_requests.popitem(last=False)
 
     def __call__(self, request):
         # We only limit POST requests (sending messages)
@@ -61,37 +157,62 @@ class OffensiveLanguageMiddleware:
             # Get IP address
             ip = request.META.get('REMOTE_ADDR')
             current_time = time.time()
-            
-            # Initialize list for this IP if not exists
-            if ip not in self.ip_requests:
-                self.ip_requests[ip] = []
-
-            # Filter out timestamps older than 60 seconds (1 minute window)
-            # We keep only requests made in the last 60 seconds
-            self.ip_requests[ip] = [t for t in self.ip_requests[ip] if current_time - t < 60]
-
-            # Check if count exceeds limit (5 requests per minute)
-            if len(self.ip_requests[ip]) >= 5:
-                return JsonResponse(
-                    {'error': 'Rate limit exceeded. You can only send 5 messages per minute.'}, 
-                    status=429 # HTTP 429 Too Many Requests
-                )
+            window = int(current_time // 60)
 
-            # Add current timestamp to history
-            self.ip_requests[ip].append(current_time)
+            with self.lock:
+                state = self.ip_requests.get(ip)
+                if state is None:
+                    # Make room before tracking a new IP
+                    self._evict(window)
+                    state = (window, 0, 0)
+                else:
+                    self.ip_requests.move_to_end(ip)
+                window_start, current_count, previous_count = state
+
+                # Roll forward when a new 60-second window starts; a gap of more than
+                # one window means the previous window saw no requests
+                if window != window_start:
+                    previous_count = current_count if window == window_start + 1 else 0
+                    current_count = 0
+
+                # Estimate requests in the last 60 seconds by weighting the previous
+                # window by how much of it still overlaps the sliding minute
+                estimate = previous_count * (60 - current_time % 60) / 60 + current_count
+
+                # Check if count exceeds limit (5 requests per minute);
+                # only allowed requests are counted
+                limited = estimate >= 5
+                if not limited:
+                    current_count += 1
+                self.ip_requests[ip] = (window, current_count, previous_count)
+
+            if limited:
+                return HttpResponse(
+                    self._429_response_body,
+                    status=429, # HTTP 429 Too Many Requests
+                    content_type='application/json'
+                )
 
         response = self.get_response(request)
         return response
     
 
 class RolepermissionMiddleware:
+    # Roles allowed through, and path prefixes that are never checked
+    _ALLOWED_ROLES = frozenset({'admin', 'moderator'})
+    _EXEMPT_PREFIXES = ('/admin/', '/static/')
+
     def __init__(self, get_response):
         self.get_response = get_response
+        # Denial body encoded once instead of on every rejected request
+        self._403_response_body = json.dumps(
+            {'error': 'Forbidden: Access denied. Requires Admin or Moderator role.'}
+        ).encode()
 
     def __call__(self, request):
         # We generally only check permissions for authenticated users
         # and usually exclude the admin site itself to prevent locking yourself out
-        if request.path.startswith('/admin/'):
+        if request.path.startswith(self._EXEMPT_PREFIXES):
              return self.get_response(request)
 
         if request.user.is_authenticated:
@@ -99,10 +220,9 @@ class RolepermissionMiddleware:
             role = getattr(request.user, 'role', '').lower()
             
             # Allow only 'admin' or 'moderator'
-            if role not in ['admin', 'moderator']:
-                return JsonResponse(
-                    {'error': 'Forbidden: Access denied. Requires Admin or Moderator role.'}, 
-                    status=403
+            if role not in self._ALLOWED_ROLES:
+                return HttpResponse(
+                    self._403_response_body, status=403, content_type='application/json'
                 )
         
         # Note: Depending on requirements, you might also want to block 
@@ -20,21 +20,34 @@ class User(AbstractUser):
     role = models.CharField(max_length=10, choices=ROLE_CHOICES, default='guest')
     created_at = models.DateTimeField(auto_now_add=True)
 
-    # Resolve conflict with built-in auth groups/permissions
-    groups = models.ManyToManyField(
-        'auth.Group',
-        related_name='chats_user_set',
-        blank=True
-    )
-    user_permissions = models.ManyToManyField(
-        'auth.Permission',
-        related_name='chats_user_permissions_set',
-        blank=True
-    )
+    # Access is governed by roles and IsParticipantOfConversation, not Django's
+    # group/permission tables, so drop those relations entirely
+    groups = None
+    user_permissions = None
 
     def __str__(self):
         return self.username
 
+    # Without groups/user_permissions only superusers hold model permissions;
+    # answered here so no auth backend queries the removed relations
+    def get_user_permissions(self, obj=None):
+        return set()
+
+    def get_group_permissions(self, obj=None):
+        return set()
+
+    def get_all_permissions(self, obj=None):
+        return set()
+
+    def has_perm(self, perm, obj=None):
+        return self.is_active and self.is_superuser
+
+    def has_perms(self, perm_list, obj=None):
+        return all(self.has_perm(perm, obj) for perm in perm_list)
+
+    def has_module_perms(self, app_label):
+        return self.is_active and self.is_superuser
+
 class Conversation(models.Model):
     conversation_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     participants = models.ManyToManyField(User, related_name='conversations')
@@ -50,6 +63,14 @@ class Message(models.Model):
     message_body = models.TextField()
     sent_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Messages of a conversation in send order
+            models.Index(fields=['conversation', 'sent_at'], name='message_conv_sent_idx'),
+            # Messages sent by a user in send order
+            models.Index(fields=['sender', 'sent_at'], name='message_sender_sent_idx'),
+        ]
+
     def __str__(self):
         return f"Message {self.message_id} by {self.sender}"
     
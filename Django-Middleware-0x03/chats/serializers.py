@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import serializers
 from .models import User, Conversation, Message
 
@@ -13,13 +14,93 @@ class MessageSerializer(serializers.ModelSerializer):
         model = Message
         fields = ['message_id', 'sender', 'message_body', 'sent_at']
 
+# Columns loaded for each rendered message: the serialized fields, its
+# conversation, and the sender's username that StringRelatedField renders
+MESSAGE_LOAD_FIELDS = (
+    *[field for field in MessageSerializer.Meta.fields if field != 'sender'],
+    'conversation_id', 'sender__user_id', 'sender__username',
+)
+
+class BulkUserIdsField(serializers.ListField):
+    """
+    List of user ids resolved with a single query; returns the set of ids.
+    """
+    child = serializers.UUIDField()
+
+    def to_internal_value(self, data):
+        ids = set(super().to_internal_value(data))
+        found = set(User.objects.filter(pk__in=ids).values_list('pk', flat=True))
+        missing = ids - found
+        if missing:
+            raise serializers.ValidationError(
+                f"Unknown user ids: {', '.join(sorted(str(pk) for pk in missing))}"
+            )
+        return ids
+
+class ConversationListSerializer(serializers.Serializer):
+    # Flat summary for list views, built from .values() rows
+    conversation_id = serializers.UUIDField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
 class ConversationSerializer(serializers.ModelSerializer):
     participants = UserSerializer(many=True, read_only=True)
-    messages = MessageSerializer(many=True, read_only=True)  
+    # Only the latest messages are embedded; the full history is paginated
+    # through the messages endpoint
+    messages = serializers.SerializerMethodField()
+    participant_ids = BulkUserIdsField(write_only=True, required=False)
 
     class Meta:
         model = Conversation
-        fields = ['conversation_id', 'participants', 'messages', 'created_at']
+        fields = ['conversation_id', 'participants', 'messages', 'created_at', 'participant_ids']
+
+    # Number of most recent messages embedded in each conversation
+    latest_messages_limit = 20
+
+    @classmethod
+    def latest_messages(cls, conversation):
+        # Newest messages first from the database, returned in sent_at order;
+        # kept on the instance so the view and serializer share one query
+        messages = getattr(conversation, '_latest_messages', None)
+        if messages is None:
+            messages = conversation._latest_messages = list(
+                conversation.messages.select_related('sender')
+                .only(*MESSAGE_LOAD_FIELDS)
+                .order_by('-sent_at')[:cls.latest_messages_limit]
+            )[::-1]
+        return messages
+
+    def get_messages(self, obj):
+        return MessageSerializer(
+            self.latest_messages(obj), many=True, context=self.context
+        ).data
+
+    def validate(self, attrs):
+        # Participants are only set on create; update() has no membership
+        # handling, so refuse the field instead of silently dropping it
+        if self.instance is not None and 'participant_ids' in attrs:
+            raise serializers.ValidationError({
+                'participant_ids': 'Participants can only be set when creating a conversation.'
+            })
+        return attrs
+
+    def create(self, validated_data):
+        participant_ids = validated_data.pop('participant_ids', set())
+        creator = validated_data.pop('creator', None)
+
+        # The creator always takes part
+        if creator is not None:
+            participant_ids.add(creator.pk)
+
+        with transaction.atomic():
+            conversation = super().create(validated_data)
+            # The conversation is new, so its membership rows can be inserted
+            # directly in one statement without checking for existing ones
+            through = Conversation.participants.through
+            through.objects.bulk_create([
+                through(conversation_id=conversation.pk, user_id=user_id)
+                for user_id in participant_ids
+            ])
+        return conversation
         
         
         
\ No newline at end of file
@@ -1,25 +1,82 @@
+import hashlib
+from operator import attrgetter
+
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend # Import FilterBackend
-from django.shortcuts import get_object_or_404
+from django.db.models import Exists, OuterRef, Prefetch
+from django.utils.cache import get_conditional_response, quote_etag
 
-from .models import Conversation, Message
-from .serializers import ConversationSerializer, MessageSerializer
+from .models import Conversation, Message, User
+from .serializers import (
+    MESSAGE_LOAD_FIELDS, ConversationListSerializer, ConversationSerializer,
+    MessageSerializer, UserSerializer,
+)
 from .permissions import IsParticipantOfConversation
-from .pagination import MessagePagination  # Import Pagination
+from .pagination import ConversationPagination, MessagePagination  # Import Pagination
 from .filters import MessageFilter         # Import Filter
 
 class ConversationViewSet(viewsets.ModelViewSet):
     serializer_class = ConversationSerializer
     permission_classes = [IsAuthenticated, IsParticipantOfConversation]
+    pagination_class = ConversationPagination
 
     def get_queryset(self):
-        return Conversation.objects.filter(participants=self.request.user)
+        # Membership is probed with EXISTS on the participants table rather
+        # than joining it into the main query
+        membership = Conversation.participants.through.objects.filter(
+            conversation_id=OuterRef('pk'), user_id=self.request.user.pk
+        )
+        queryset = Conversation.objects.filter(Exists(membership)).order_by('-created_at')
+        if self.action == 'list':
+            # Listing only needs the summary columns; skip building model instances
+            return queryset.values('conversation_id', 'created_at')
+        # The serializer fetches just the latest messages itself; participants
+        # load only the columns UserSerializer renders
+        return queryset.prefetch_related(
+            Prefetch(
+                'participants',
+                queryset=User.objects.only(*UserSerializer.Meta.fields)
+            )
+        )
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ConversationListSerializer
+        return super().get_serializer_class()
+
+    def retrieve(self, request, *args, **kwargs):
+        conversation = self.get_object()
+
+        # The ETag fingerprints exactly what the response renders: the
+        # (already prefetched) participants and the latest messages, which
+        # are loaded here once and reused by the serializer. Sending,
+        # editing or deleting a rendered message changes it. Values are
+        # read through the serializers' own field lists, so a newly
+        # serialized field is covered too; a sender reprs as its username.
+        messages = ConversationSerializer.latest_messages(conversation)
+        user_state = attrgetter(*UserSerializer.Meta.fields)
+        message_state = attrgetter(*MessageSerializer.Meta.fields)
+        state = (
+            conversation.pk,
+            [user_state(u) for u in conversation.participants.all()],
+            [message_state(m) for m in messages],
+        )
+        etag = quote_etag(hashlib.md5(repr(state).encode()).hexdigest())
+
+        # Unchanged since the client's copy: answer 304 without serializing
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            # Like django.views.decorators.http.condition, repeat the ETag
+            not_modified['ETag'] = etag
+            return not_modified
+
+        serializer = self.get_serializer(conversation)
+        return Response(serializer.data, headers={'ETag': etag})
 
     def perform_create(self, serializer):
-        conversation = serializer.save()
-        conversation.participants.add(self.request.user)
+        serializer.save(creator=self.request.user)
 
 class MessageViewSet(viewsets.ModelViewSet):
     serializer_class = MessageSerializer
@@ -31,7 +88,10 @@ class MessageViewSet(viewsets.ModelViewSet):
     filterset_class = MessageFilter
 
     def get_queryset(self):
-        return Message.objects.filter(conversation__participants=self.request.user)
+        # The serializer renders each message's sender, so join it in up front
+        return Message.objects.select_related('sender').only(*MESSAGE_LOAD_FIELDS).filter(
+            conversation__participants=self.request.user
+        )
 
     def create(self, request, *args, **kwargs):
         conversation_id = request.data.get('conversation_id')
@@ -41,9 +101,14 @@ class MessageViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        conversation = get_object_or_404(Conversation, conversation_id=conversation_id)
-        
-        if request.user not in conversation.participants.all():
+        # Check the conversation exists and includes the user in one EXISTS
+        # query; a missing conversation and one the user is not part of are
+        # both refused
+        is_participant = Conversation.objects.filter(
+            conversation_id=conversation_id, participants=request.user
+        ).exists()
+
+        if not is_participant:
             return Response(
                 {"error": "You are not a participant of this conversation"}, 
                 status=status.HTTP_403_FORBIDDEN
@@ -52,9 +117,11 @@ class MessageViewSet(viewsets.ModelViewSet):
         return super().create(request, *args, **kwargs)
 
     def perform_create(self, serializer):
-        conversation_id = self.request.data.get('conversation_id')
-        conversation = get_object_or_404(Conversation, conversation_id=conversation_id)
-        serializer.save(sender=self.request.user, conversation=conversation)
+        # Membership was checked in create(); the message only needs the id
+        serializer.save(
+            sender=self.request.user,
+            conversation_id=self.request.data.get('conversation_id')
+        )
         
         
         
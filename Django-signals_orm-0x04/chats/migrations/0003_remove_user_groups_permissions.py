@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chats', '0002_message_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='user',
+            name='groups',
+        ),
+        migrations.RemoveField(
+            model_name='user',
+            name='user_permissions',
+        ),
+    ]
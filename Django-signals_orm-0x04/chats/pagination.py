@@ -14,5 +14,9 @@ class MessagePagination(PageNumberPagination):
             'previous': self.get_previous_link(),
             'results': data
         })
-        
-        
\ No newline at end of file
+
+
+class ConversationPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 50
@@ -29,6 +29,16 @@ class Message(models.Model):
     objects = models.Manager()  # The default manager
     unread = UnreadMessagesManager()  # The custom manager (Task 4)
 
+    class Meta:
+        indexes = [
+            # Inbox lookups: unread_for_user and unread_messages_view
+            models.Index(fields=['receiver', 'read', 'timestamp'], name='msg_recv_read_ts_idx'),
+            # Threaded replies ordered by timestamp
+            models.Index(fields=['parent_message', 'timestamp'], name='msg_parent_ts_idx'),
+            # Only unread rows, matching the read=False predicate
+            models.Index(fields=['receiver'], condition=models.Q(read=False), name='msg_unread_by_recv'),
+        ]
+
     def __str__(self):
         return f"Message from {self.sender} to {self.receiver}"
 
@@ -1,7 +1,10 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Prefetch
 from django.views.decorators.cache import cache_page # Import cache_page
+from django.views.decorators.vary import vary_on_cookie
 from .models import Message
 
 @login_required
@@ -14,21 +17,23 @@ def delete_user(request):
 
 @login_required
 @cache_page(60) # Task 5: Cache this view for 60 seconds
+@vary_on_cookie # Cache per session so one user's page is never served to another
 def conversation_view(request, message_id):
     """
     Task 3: Displays a message and its replies.
     Task 5: Cached for 60 seconds.
     """
+    replies = Message.objects.select_related('sender', 'receiver').order_by('timestamp')
     message = get_object_or_404(
-        Message.objects.select_related('sender', 'receiver'), 
+        Message.objects.select_related('sender', 'receiver').prefetch_related(
+            Prefetch('replies', queryset=replies, to_attr='ordered_replies')
+        ),
         pk=message_id
     )
 
-    replies = Message.objects.filter(parent_message=message).select_related('sender', 'receiver').order_by('timestamp')
-
     return render(request, 'messaging/conversation.html', {
         'message': message, 
-        'replies': replies
+        'replies': message.ordered_replies
     })
 
 @login_required
@@ -38,12 +43,15 @@ def reply_to_message(request, message_id):
     if request.method == 'POST':
         content = request.POST.get('content')
         
-        Message.objects.create(
-            sender=request.user,
-            receiver=parent_message.sender,
-            content=content,
-            parent_message=parent_message
-        )
+        # The reply and the notification created by its post_save signal
+        # are written in one transaction with a single commit
+        with transaction.atomic():
+            Message.objects.create(
+                sender=request.user,
+                receiver=parent_message.sender,
+                content=content,
+                parent_message=parent_message
+            )
         
         return redirect('conversation_view', message_id=message_id)
         
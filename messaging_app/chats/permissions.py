@@ -8,13 +8,39 @@ class IsParticipantOfConversation(permissions.BasePermission):
     def has_permission(self, request, view):
         return request.user and request.user.is_authenticated
 
+    @staticmethod
+    def _is_conversation_participant(user, conversation):
+        if 'participants' in getattr(conversation, '_prefetched_objects_cache', {}):
+            # Participants were already prefetched by the view; check them in memory
+            return any(u.pk == user.pk for u in conversation.participants.all())
+        # Membership is checked with an EXISTS query rather than loading every participant
+        return conversation.participants.filter(pk=user.pk).exists()
+
     def has_object_permission(self, request, view, obj):
         # 1. Determine if user is a participant
+        # Results are cached on the request per conversation, so repeated
+        # checks within one request do not query again
+        cache = getattr(request, '_conv_participant_cache', None)
+        if cache is None:
+            cache = request._conv_participant_cache = {}
+
         is_participant = False
-        if hasattr(obj, 'participants'):
-            is_participant = request.user in obj.participants.all()
-        elif hasattr(obj, 'conversation'):
-            is_participant = request.user in obj.conversation.participants.all()
+        if request.user.is_superuser:
+            # Superusers may access any conversation; skip the membership
+            # lookup but still apply the write rules below
+            is_participant = True
+        elif hasattr(obj, 'participants'):
+            key = obj.pk
+            if key not in cache:
+                cache[key] = self._is_conversation_participant(request.user, obj)
+            is_participant = cache[key]
+        elif hasattr(obj, 'conversation_id'):
+            # A message. Only its conversation_id column is read; touching
+            # obj.conversation (even through hasattr) would load the row
+            key = obj.conversation_id
+            if key not in cache:
+                cache[key] = request.user.conversations.filter(pk=key).exists()
+            is_participant = cache[key]
 
         if not is_participant:
             return False
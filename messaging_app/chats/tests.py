@@ -1,3 +1,299 @@
+from types import SimpleNamespace
+
 from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from .models import Conversation, Message, User
+from .permissions import IsParticipantOfConversation
 
 # Create your tests here.
+
+
+class ChatsAPITestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create_user(
+            username='alice', email='alice@example.com', password='password'
+        )
+        cls.bob = User.objects.create_user(
+            username='bob', email='bob@example.com', password='password'
+        )
+        cls.carol = User.objects.create_user(
+            username='carol', email='carol@example.com', password='password'
+        )
+        cls.conversation = Conversation.objects.create()
+        cls.conversation.participants.add(cls.alice, cls.bob)
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.alice)
+
+    def conversation_url(self, conversation):
+        return reverse('conversation-detail', args=[conversation.pk])
+
+    def message_url(self, message):
+        return reverse('message-detail', args=[message.pk])
+
+
+class QueryCountTest(ChatsAPITestCase):
+    """
+    Pins the number of queries per endpoint so it does not grow with the
+    number of conversations, participants or messages.
+    """
+
+    def add_conversations(self, count, messages_each):
+        for _ in range(count):
+            conversation = Conversation.objects.create()
+            conversation.participants.add(self.alice, self.bob, self.carol)
+            for sender in (self.alice, self.bob, self.carol)[:messages_each]:
+                Message.objects.create(
+                    sender=sender, conversation=conversation, message_body='hello'
+                )
+
+    def test_conversation_list(self):
+        self.add_conversations(5, messages_each=3)
+
+        # Count query and one page of values() rows
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('conversation-list'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 6)
+
+    def test_conversation_retrieve(self):
+        for sender in (self.alice, self.bob) * 3:
+            Message.objects.create(
+                sender=sender, conversation=self.conversation, message_body='hi'
+            )
+
+        # Conversation, participants and latest messages
+        with self.assertNumQueries(3):
+            response = self.client.get(self.conversation_url(self.conversation))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['participants']), 2)
+        self.assertEqual(len(response.data['messages']), 6)
+
+    def test_message_list(self):
+        self.add_conversations(3, messages_each=3)
+
+        # Count query and one page of messages joined with their senders
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('message-list'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 9)
+        self.assertEqual(
+            {m['sender'] for m in response.data['results']}, {'alice', 'bob', 'carol'}
+        )
+
+
+class ConversationParticipantsTest(ChatsAPITestCase):
+    def test_create_adds_participants_and_creator(self):
+        response = self.client.post(
+            reverse('conversation-list'),
+            {'participant_ids': [str(self.bob.pk), str(self.carol.pk)]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            {p['username'] for p in response.data['participants']},
+            {'alice', 'bob', 'carol'},
+        )
+
+    def test_create_rejects_unknown_ids(self):
+        missing = '00000000-0000-0000-0000-000000000000'
+        response = self.client.post(
+            reverse('conversation-list'),
+            {'participant_ids': [str(self.bob.pk), missing]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(missing, str(response.data['participant_ids']))
+        self.assertEqual(Conversation.objects.count(), 1)
+
+    def test_update_rejects_participant_ids(self):
+        response = self.client.patch(
+            self.conversation_url(self.conversation),
+            {'participant_ids': [str(self.carol.pk)]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('participant_ids', response.data)
+        self.assertEqual(
+            set(self.conversation.participants.values_list('username', flat=True)),
+            {'alice', 'bob'},
+        )
+
+
+class ParticipantPermissionTest(ChatsAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.admin = User.objects.create_superuser(
+            username='admin', email='admin@example.com', password='password'
+        )
+        cls.conversation.participants.add(cls.admin)
+        cls.bob_message = Message.objects.create(
+            sender=cls.bob, conversation=cls.conversation, message_body='from bob'
+        )
+
+    def patch_bob_message(self, user):
+        self.client.force_authenticate(user)
+        return self.client.patch(
+            self.message_url(self.bob_message), {'message_body': 'changed'}, format='json'
+        )
+
+    def test_sender_can_edit_own_message(self):
+        response = self.patch_bob_message(self.bob)
+
+        self.assertEqual(response.status_code, 200)
+        self.bob_message.refresh_from_db()
+        self.assertEqual(self.bob_message.message_body, 'changed')
+
+    def test_participant_cannot_edit_others_message(self):
+        response = self.patch_bob_message(self.alice)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_superuser_cannot_edit_others_message(self):
+        response = self.patch_bob_message(self.admin)
+
+        self.assertEqual(response.status_code, 403)
+        self.bob_message.refresh_from_db()
+        self.assertEqual(self.bob_message.message_body, 'from bob')
+
+    def test_superuser_can_read_messages(self):
+        self.client.force_authenticate(self.admin)
+
+        # Only the message itself: the superuser skips the membership EXISTS
+        with self.assertNumQueries(1):
+            response = self.client.get(self.message_url(self.bob_message))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_superuser_passes_without_membership(self):
+        permission = IsParticipantOfConversation()
+        root = User.objects.create_superuser(
+            username='root', email='root@example.com', password='password'
+        )
+        message = Message.objects.get(pk=self.bob_message.pk)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(permission.has_object_permission(
+                SimpleNamespace(user=root, method='GET'), None, message
+            ))
+
+    def test_non_participant_cannot_see_conversation(self):
+        self.client.force_authenticate(self.carol)
+
+        response = self.client.get(self.conversation_url(self.conversation))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_message_retrieve_does_not_load_conversation(self):
+        # Message joined with its sender, then one membership EXISTS
+        with self.assertNumQueries(2):
+            response = self.client.get(self.message_url(self.bob_message))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_membership_is_cached_per_request(self):
+        permission = IsParticipantOfConversation()
+        request = SimpleNamespace(user=self.alice, method='GET')
+        Message.objects.create(
+            sender=self.alice, conversation=self.conversation, message_body='hi'
+        )
+        # Fresh instances, so no conversation is cached on them
+        bob_message, other_message = Message.objects.order_by('sent_at')
+
+        # Both messages belong to the same conversation: one lookup
+        with self.assertNumQueries(1):
+            self.assertTrue(permission.has_object_permission(request, None, bob_message))
+            self.assertTrue(permission.has_object_permission(request, None, other_message))
+
+    def test_prefetched_participants_need_no_query(self):
+        permission = IsParticipantOfConversation()
+        conversation = Conversation.objects.prefetch_related('participants').get(
+            pk=self.conversation.pk
+        )
+
+        with self.assertNumQueries(0):
+            self.assertTrue(permission.has_object_permission(
+                SimpleNamespace(user=self.alice, method='GET'), None, conversation
+            ))
+            self.assertFalse(permission.has_object_permission(
+                SimpleNamespace(user=self.carol, method='GET'), None, conversation
+            ))
+
+
+class ConversationETagTest(ChatsAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.older = Message.objects.create(
+            sender=cls.bob, conversation=cls.conversation, message_body='older'
+        )
+        cls.newer = Message.objects.create(
+            sender=cls.alice, conversation=cls.conversation, message_body='newer'
+        )
+
+    def get_conversation(self, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(self.conversation_url(self.conversation), **headers)
+
+    def test_unchanged_conversation_returns_304(self):
+        etag = self.get_conversation()['ETag']
+
+        with self.assertNumQueries(3):
+            response = self.get_conversation(etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_deleting_older_message_changes_etag(self):
+        etag = self.get_conversation()['ETag']
+        self.client.force_authenticate(self.bob)
+        self.assertEqual(self.client.delete(self.message_url(self.older)).status_code, 204)
+        self.client.force_authenticate(self.alice)
+
+        response = self.get_conversation(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual([m['message_body'] for m in response.data['messages']], ['newer'])
+
+    def test_editing_message_changes_etag(self):
+        etag = self.get_conversation()['ETag']
+        self.client.force_authenticate(self.bob)
+        self.client.patch(self.message_url(self.older), {'message_body': 'edited'}, format='json')
+        self.client.force_authenticate(self.alice)
+
+        response = self.get_conversation(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_participant_profile_change_changes_etag(self):
+        etag = self.get_conversation()['ETag']
+        User.objects.filter(pk=self.bob.pk).update(phone_number='555-0100')
+
+        response = self.get_conversation(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_new_participant_changes_etag(self):
+        etag = self.get_conversation()['ETag']
+        self.conversation.participants.add(self.carol)
+
+        response = self.get_conversation(etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['participants']), 3)
+